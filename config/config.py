@@ -1,23 +1,75 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 
 class Config:
     """Application configuration."""
     env_path = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=env_path)
+
+    # Storage URI; sqlite:///path selects the embedded SQLite backend,
+    # otherwise MONGO_URI is used (populated on first load)
+    DATABASE_URI = None
 
     # MongoDB Configuration
-    MONGO_URI = os.getenv('MONGO_URI')
-    MONGO_DATABASE = os.getenv('MONGO_DB')
-    MONGO_COLLECTION = os.getenv('MONGO_COLLECTION')
-    
+    MONGO_URI = None
+    MONGO_DATABASE = None
+    MONGO_COLLECTION = None
+    MONGO_TIMEOUT_MS = 5000
+
+    # Resilience policy for database operations
+    DB_OPERATION_TIMEOUT = 10.0
+    DB_MAX_ATTEMPTS = 3
+    DB_CIRCUIT_FAILURES = 5
+    DB_CIRCUIT_RESET = 30.0
+
+    _database_config = None
+    _resilience_config = None
+
+    @classmethod
+    def load(cls):
+        """Read the .env file and environment once, caching the result"""
+        if cls._database_config is not None:
+            return cls._database_config
+
+        if cls.env_path.exists():
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=cls.env_path)
+
+        cls.MONGO_URI = os.getenv('MONGO_URI')
+        cls.MONGO_DATABASE = os.getenv('MONGO_DB')
+        cls.MONGO_COLLECTION = os.getenv('MONGO_COLLECTION')
+        cls.DATABASE_URI = os.getenv('DATABASE_URI') or cls.MONGO_URI
+        cls.MONGO_TIMEOUT_MS = int(os.getenv('MONGO_TIMEOUT_MS', cls.MONGO_TIMEOUT_MS))
+
+        cls.DB_OPERATION_TIMEOUT = float(os.getenv('DB_OPERATION_TIMEOUT', cls.DB_OPERATION_TIMEOUT))
+        cls.DB_MAX_ATTEMPTS = int(os.getenv('DB_MAX_ATTEMPTS', cls.DB_MAX_ATTEMPTS))
+        cls.DB_CIRCUIT_FAILURES = int(os.getenv('DB_CIRCUIT_FAILURES', cls.DB_CIRCUIT_FAILURES))
+        cls.DB_CIRCUIT_RESET = float(os.getenv('DB_CIRCUIT_RESET', cls.DB_CIRCUIT_RESET))
+
+        # A single driver wait must not outlast the whole operation deadline
+        cls.MONGO_TIMEOUT_MS = min(cls.MONGO_TIMEOUT_MS, int(cls.DB_OPERATION_TIMEOUT * 1000))
+
+        cls._resilience_config = {
+            'timeout': cls.DB_OPERATION_TIMEOUT,
+            'max_attempts': cls.DB_MAX_ATTEMPTS,
+            'failure_threshold': cls.DB_CIRCUIT_FAILURES,
+            'reset_timeout': cls.DB_CIRCUIT_RESET
+        }
+        cls._database_config = {
+            'uri': cls.DATABASE_URI,
+            'db_name': cls.MONGO_DATABASE,
+            'collection_name': cls.MONGO_COLLECTION,
+            'timeout_ms': cls.MONGO_TIMEOUT_MS
+        }
+        return cls._database_config
+
     @classmethod
     def get_database_config(cls):
         """Get database configuration"""
-        return {
-            'uri': cls.MONGO_URI,
-            'db_name': cls.MONGO_DATABASE,
-            'collection_name': cls.MONGO_COLLECTION
-        }
\ No newline at end of file
+        return dict(cls.load())
+
+    @classmethod
+    def get_resilience_config(cls):
+        """Get deadline, retry and circuit breaker settings"""
+        cls.load()
+        return dict(cls._resilience_config)
@@ -0,0 +1 @@
+# Keeps the project root importable (config, db, manager, models) under pytest
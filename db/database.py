@@ -1,7 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 
-from models.task import Task
+from models.task import Task, Priority, Status
+
+# Orderings accepted by find_tasks: soonest due, highest priority, oldest first
+SORT_KEYS = ('due_date', 'priority', 'creation_timestamp')
+
+PRIORITY_RANK = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+# Database URIs with this prefix select the embedded SQLite backend
+SQLITE_URI_PREFIX = "sqlite:///"
+
+
+def is_sqlite_uri(uri: Optional[str]) -> bool:
+    return bool(uri) and uri.startswith(SQLITE_URI_PREFIX)
+
+
+def validate_sort_key(sort_by: Optional[str]) -> None:
+    """Reject orderings find_tasks does not support"""
+    if sort_by is not None and sort_by not in SORT_KEYS:
+        raise ValueError(f"Invalid sort key: {sort_by}")
 
 
 class DatabaseInterface(ABC):
@@ -11,12 +30,20 @@ class DatabaseInterface(ABC):
 
     @abstractmethod
     def connect(self) -> None:
-        """For Mongo database connection"""
+        """Open the database connection"""
         pass
 
     @abstractmethod
     def disconnect(self) -> None:
-        """For Mongo database disconnection"""
+        """Close the database connection"""
+        pass
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """
+        Bound how long, in seconds, the next operation may wait on the
+        database. None restores the backend's configured timeout.
+        Backends that cannot bound their waits may ignore this.
+        """
         pass
 
     @abstractmethod
@@ -24,11 +51,47 @@ class DatabaseInterface(ABC):
         """Add a task into the database"""
         pass
 
+    def add_tasks(self, tasks: List[Task]) -> int:
+        """
+        Add several tasks, returning how many were stored. Backends should
+        override this to write the batch in one round trip or transaction.
+        """
+        return sum(1 for task in tasks if self.add_task(task))
+
     @abstractmethod
     def get_all_tasks(self) -> List[Task]:
         """Retrieve all tasks from the database"""
         pass
 
+    def find_tasks(self,
+                   status: Optional[Status] = None,
+                   priority: Optional[Priority] = None,
+                   due_before: Optional[datetime] = None,
+                   sort_by: Optional[str] = None) -> List[Task]:
+        """
+        Retrieve tasks matching the given filters, optionally sorted by one
+        of SORT_KEYS. Backends should override this to filter in the database.
+        """
+        validate_sort_key(sort_by)
+
+        tasks = self.get_all_tasks()
+
+        if status:
+            tasks = [t for t in tasks if t.status == status]
+
+        if priority:
+            tasks = [t for t in tasks if t.priority == priority]
+
+        if due_before:
+            tasks = [t for t in tasks if t.due_date <= due_before]
+
+        if sort_by == 'priority':
+            tasks.sort(key=lambda t: PRIORITY_RANK[t.priority])
+        elif sort_by:
+            tasks.sort(key=lambda t: getattr(t, sort_by))
+
+        return tasks
+
     @abstractmethod
     def get_task(self, task_id: str) -> Task:
         """Retrieve a single task by ID from the database"""
@@ -1,10 +1,37 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-from pymongo import MongoClient
-from pymongo.errors import PyMongoError
+from db.database import DatabaseInterface, PRIORITY_RANK, validate_sort_key
+from db.errors import DatabaseError, TransientDatabaseError
+from models.task import Task, Priority, Status
+
+
+class _DriverMissing(Exception):
+    """Stand-in for PyMongoError when pymongo is not installed; never raised"""
+
+
+@lru_cache(maxsize=None)
+def _pymongo_error():
+    """Import PyMongoError on demand so pymongo stays off the startup path"""
+    try:
+        from pymongo.errors import PyMongoError
+    except ImportError:
+        # _open reports the missing driver as a DatabaseError
+        return _DriverMissing
+    return PyMongoError
+
+
+def _translate_error(action: str, error: Exception) -> DatabaseError:
+    """Map a pymongo error onto the retryable / non-retryable error types"""
+    from pymongo.errors import ConnectionFailure, ExecutionTimeout, WTimeoutError
+
+    message = f"Error {action}: {error}"
+    if (isinstance(error, (ConnectionFailure, ExecutionTimeout, WTimeoutError))
+            or error.has_error_label("RetryableWriteError")):
+        return TransientDatabaseError(message)
+    return DatabaseError(message)
 
-from db.database import DatabaseInterface
-from models.task import Task
 
 class DatabaseManager(DatabaseInterface):
     """MongoDB implementation for storage"""
@@ -12,78 +39,188 @@ class DatabaseManager(DatabaseInterface):
     def __init__(self, 
                  uri: str, 
                  db_name: str,
-                 collection_name: str):
+                 collection_name: str,
+                 timeout_ms: int = 5000):
         self.uri = uri
         self.db_name = db_name
         self.collection_name = collection_name
+        self.timeout_ms = timeout_ms
         self.client = None
         self.db = None
-        self.collection = None
+        self._collection = None
+        self._operation_timeout_ms = None
+
+    @property
+    def collection(self):
+        """Collection handle, building the client on first database use"""
+        if self._collection is None:
+            self._open()
+        return self._collection
 
     def connect(self):
+        # The client is created lazily by the first operation that needs it,
+        # so connecting is free until the database is actually used.
+        pass
+
+    def _open(self):
+        if not self.uri or not self.db_name or not self.collection_name:
+            raise DatabaseError(
+                "MongoDB is not configured: set MONGO_URI, MONGO_DB and MONGO_COLLECTION")
+
         try:
-            self.client = MongoClient(self.uri)
+            from pymongo import MongoClient
+        except ImportError as e:
+            raise DatabaseError(f"MongoDB driver is not installed: {e}") from e
+
+        try:
+            # Bound every network wait so a dead server surfaces as a
+            # timeout error instead of hanging the caller
+            client = MongoClient(self.uri,
+                                 serverSelectionTimeoutMS=self.timeout_ms,
+                                 connectTimeoutMS=self.timeout_ms,
+                                 socketTimeoutMS=self.timeout_ms)
+            db = client[self.db_name]
+            collection = db[self.collection_name]
+        except _pymongo_error() as e:
+            raise _translate_error("connecting to MongoDB", e) from e
+        except (TypeError, ValueError) as e:
+            # Invalid client options or database/collection names
+            raise DatabaseError(f"Error connecting to MongoDB: {e}") from e
+
+        self.client = client
+        self.db = db
+        self._collection = collection
+
+        print(f"Connected to MongoDB: {self.db_name}")
 
-            self.db = self.client[self.db_name]
-            self.collection = self.db[self.collection_name]
+    def set_timeout(self, timeout):
+        if timeout is None:
+            self._operation_timeout_ms = None
+        else:
+            self._operation_timeout_ms = max(1, min(self.timeout_ms, int(timeout * 1000)))
 
-            print(f"Connected to MongoDB: {self.db_name}")
-        except Exception as e:
-            print(f"Error connecting to MongoDB: {e}")
-            raise
+    def _max_time_ms(self) -> int:
+        """Server-side time limit for the current operation"""
+        return self._operation_timeout_ms or self.timeout_ms
+
+    def _writer(self):
+        """Collection handle whose write concern waits no longer than the budget"""
+        collection = self.collection
+        concern = dict(collection.write_concern.document)
+
+        # wtimeout only bounds waiting for other replica set members
+        if concern.get('w') in (None, 0, 1):
+            return collection
+
+        from pymongo import WriteConcern
+
+        # Keep w/j/fsync from the URI and only tighten the timeout
+        concern['wtimeout'] = self._max_time_ms()
+        return collection.with_options(write_concern=WriteConcern(**concern))
 
     def disconnect(self):
         if self.client:
             self.client.close()
+            self.client = None
+            self.db = None
+            self._collection = None
             print("Disconnected from MongoDB")
 
     def add_task(self, task: Task) -> bool:
         try:
             task_dict = task.to_dict()
-            self.collection.insert_one(task_dict)
+            # Upsert keyed on task_id so a retried insert cannot duplicate
+            self._writer().update_one(
+                {"task_id": task.task_id},
+                {"$setOnInsert": task_dict},
+                upsert=True
+            )
             return True
-        except PyMongoError as e:
-            print(f"Error adding task1: {e}")
-            return False
+        except _pymongo_error() as e:
+            raise _translate_error("adding task", e) from e
+
+    def add_tasks(self, tasks: List[Task]) -> int:
+        if not tasks:
+            return 0
+        try:
+            from pymongo import UpdateOne
+
+            requests = [
+                UpdateOne({"task_id": task.task_id},
+                          {"$setOnInsert": task.to_dict()},
+                          upsert=True)
+                for task in tasks
+            ]
+            result = self._writer().bulk_write(requests, ordered=False)
+            return result.upserted_count
+        except _pymongo_error() as e:
+            raise _translate_error("adding tasks", e) from e
         
     def get_task(self, task_id):
         try:
-            doc = self.collection.find_one({"task_id": task_id})
+            doc = self.collection.find_one({"task_id": task_id},
+                                           max_time_ms=self._max_time_ms())
             if doc:
                 doc.pop('_id', None)
                 return Task.from_dict(doc)
             return None
-        except PyMongoError as e:
-            print(f"Error retrieving task: {e}")
-            return None
+        except _pymongo_error() as e:
+            raise _translate_error("retrieving task", e) from e
 
     def get_all_tasks(self) -> List[Task]:
         try:
-            cursor = self.collection.find({})
+            cursor = self.collection.find({}, max_time_ms=self._max_time_ms())
             tasks = []
             for doc in cursor:
                 doc.pop('_id', None)
                 tasks.append(Task.from_dict(doc))
             return tasks
-        except PyMongoError as e:
-            print(f"Error retrieving tasks: {e}")
-            return []
+        except _pymongo_error() as e:
+            raise _translate_error("retrieving tasks", e) from e
+
+    def find_tasks(self,
+                   status: Optional[Status] = None,
+                   priority: Optional[Priority] = None,
+                   due_before: Optional[datetime] = None,
+                   sort_by: Optional[str] = None) -> List[Task]:
+        validate_sort_key(sort_by)
+
+        query = {}
+        if status:
+            query["status"] = status.value
+        if priority:
+            query["priority"] = priority.value
+        if due_before:
+            # ISO-8601 strings compare in chronological order
+            query["due_date"] = {"$lte": due_before.isoformat()}
+
+        try:
+            cursor = self.collection.find(query, {"_id": 0},
+                                          max_time_ms=self._max_time_ms())
+            if sort_by and sort_by != 'priority':
+                cursor = cursor.sort(sort_by, 1)
+            tasks = [Task.from_dict(doc) for doc in cursor]
+        except _pymongo_error() as e:
+            raise _translate_error("retrieving tasks", e) from e
+
+        if sort_by == 'priority':
+            # Priorities are stored as labels, so rank them client-side
+            tasks.sort(key=lambda t: PRIORITY_RANK[t.priority])
+        return tasks
         
     def update_task(self, task_id: str, updates: Dict[str, Any]) -> bool:
         try:
-            result = self.collection.update_one(
+            result = self._writer().update_one(
                 {"task_id": task_id},
                 {"$set": updates}
             )
-            return result.modified_count >= 1
-        except PyMongoError as e:
-            print(f"Error updating task: {e}")
-            return False
+            return result.matched_count >= 1
+        except _pymongo_error() as e:
+            raise _translate_error("updating task", e) from e
         
     def delete_task(self, task_id: str) -> bool:
         try:
-            result = self.collection.delete_one({"task_id": task_id})
+            result = self._writer().delete_one({"task_id": task_id})
             return result.deleted_count >= 1
-        except PyMongoError as e:
-            print(f"Error deleting task: {e}")
-            return False
\ No newline at end of file
+        except _pymongo_error() as e:
+            raise _translate_error("deleting task", e) from e
\ No newline at end of file
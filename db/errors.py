@@ -0,0 +1,14 @@
+class DatabaseError(Exception):
+    """Base class for database failures"""
+
+
+class TransientDatabaseError(DatabaseError):
+    """Failure that may succeed if retried (failover, network blip, timeout)"""
+
+
+class DatabaseTimeoutError(DatabaseError):
+    """Operation did not complete within its deadline"""
+
+
+class CircuitOpenError(DatabaseError):
+    """Database is considered down and calls are being rejected"""
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from db.database import DatabaseInterface, is_sqlite_uri
+
+
+def create_database(uri: Optional[str],
+                    db_name: Optional[str],
+                    collection_name: Optional[str],
+                    timeout_ms: int = 5000) -> DatabaseInterface:
+    """
+    Build the storage backend selected by the URI scheme.
+
+    sqlite:/// URIs use the embedded SQLite backend; anything else is
+    treated as a MongoDB connection string. Backends are imported here so
+    only the selected one is loaded.
+    """
+    if is_sqlite_uri(uri):
+        from db.sqlite_manager import SQLiteDatabaseManager
+        return SQLiteDatabaseManager(uri, collection_name, timeout_ms)
+
+    from db.database_manager import DatabaseManager
+    return DatabaseManager(uri, db_name, collection_name, timeout_ms)
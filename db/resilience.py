@@ -0,0 +1,254 @@
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from db.database import DatabaseInterface
+from db.errors import (CircuitOpenError, DatabaseError, DatabaseTimeoutError,
+                       TransientDatabaseError)
+from models.task import Task, Priority, Status
+
+
+# Operations whose late results are discarded; a write that has been
+# applied is reported as done, since retrying it could duplicate work
+READ_OPERATIONS = frozenset({'get_task', 'get_all_tasks', 'find_tasks'})
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for retryable database errors"""
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 base_delay: float = 0.1,
+                 max_delay: float = 2.0,
+                 rng: Optional[random.Random] = None):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+
+    def delay(self, attempt: int) -> float:
+        """
+        Backoff before the next attempt, using full jitter so clients that
+        failed together do not retry together.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self.rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the database is down.
+
+    Opens after `failure_threshold` consecutive transient failures, rejects
+    calls for `reset_timeout` seconds, then lets a single trial call through
+    (half-open) to decide whether to close again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow_request(self) -> bool:
+        if self._state == self.CLOSED:
+            return True
+
+        if self._state == self.OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        # Half-open: only one trial call at a time
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def release(self):
+        """
+        Give back a half-open trial slot without judging the server, for
+        calls that failed for reasons unrelated to its health.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+
+
+class ResilientDatabase(DatabaseInterface):
+    """
+    Wraps another DatabaseInterface with per-operation deadlines, retries
+    for transient errors and a circuit breaker.
+
+    Results from the backend are passed through unchanged, so an empty list
+    or None always means "no data"; failures surface as DatabaseError
+    subclasses.
+    """
+
+    def __init__(self,
+                 backend: DatabaseInterface,
+                 timeout: float = 10.0,
+                 timeouts: Optional[Dict[str, float]] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            backend: DatabaseInterface doing the actual work
+            timeout: Default deadline in seconds for one operation, retries included
+            timeouts: Per-operation overrides keyed by method name
+            retry_policy: Backoff policy for transient errors
+            circuit_breaker: Breaker shared by all operations
+            clock: Monotonic time source
+            sleep: Used to wait between retries
+        """
+        self.backend = backend
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(clock=clock)
+        self._clock = clock
+        self._sleep = sleep
+
+    @classmethod
+    def from_config(cls,
+                    backend: DatabaseInterface,
+                    timeout: float,
+                    max_attempts: int,
+                    failure_threshold: int,
+                    reset_timeout: float) -> 'ResilientDatabase':
+        """Build from the flat settings returned by Config.get_resilience_config"""
+        return cls(backend,
+                   timeout=timeout,
+                   retry_policy=RetryPolicy(max_attempts=max_attempts),
+                   circuit_breaker=CircuitBreaker(failure_threshold=failure_threshold,
+                                                  reset_timeout=reset_timeout))
+
+    def _call(self, operation: str, func: Callable, *args) -> Any:
+        """Run one backend operation under the retry, deadline and breaker policy"""
+        timeout = self.timeouts.get(operation, self.timeout)
+        deadline = self._clock() + timeout
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise DatabaseTimeoutError(
+                        f"{operation} did not complete within {timeout}s")
+
+                if not self.circuit_breaker.allow_request():
+                    raise CircuitOpenError(
+                        f"Database unavailable, not attempting {operation} (circuit open)")
+
+                # Keep the backend's own waits inside what is left of the budget
+                self.backend.set_timeout(remaining)
+                try:
+                    result = func(*args)
+                except TransientDatabaseError as e:
+                    self.circuit_breaker.record_failure()
+                    if self._clock() >= deadline:
+                        raise DatabaseTimeoutError(
+                            f"{operation} did not complete within {timeout}s: {e}") from e
+                    if attempt >= self.retry_policy.max_attempts:
+                        raise
+
+                    delay = self.retry_policy.delay(attempt)
+                    if self._clock() + delay >= deadline:
+                        raise DatabaseTimeoutError(
+                            f"{operation} did not complete within {timeout}s: {e}") from e
+                    self._sleep(delay)
+                    continue
+                except DatabaseError:
+                    # The server answered, so it is up; the request itself is bad
+                    self.circuit_breaker.record_success()
+                    raise
+                except Exception:
+                    # Says nothing about the server (bad argument, bad document),
+                    # but must not leave a half-open trial slot taken
+                    self.circuit_breaker.release()
+                    raise
+
+                self.circuit_breaker.record_success()
+                if operation in READ_OPERATIONS and self._clock() > deadline:
+                    # Too late to be useful to the caller, even though it worked
+                    raise DatabaseTimeoutError(
+                        f"{operation} did not complete within {timeout}s")
+                return result
+        finally:
+            self.backend.set_timeout(None)
+
+    def connect(self) -> None:
+        self.backend.connect()
+
+    def disconnect(self) -> None:
+        self.backend.disconnect()
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        # Deadlines are managed per operation by _call
+        pass
+
+    def add_task(self, task: Task) -> bool:
+        return self._call('add_task', self.backend.add_task, task)
+
+    def add_tasks(self, tasks: List[Task]) -> int:
+        return self._call('add_tasks', self.backend.add_tasks, tasks)
+
+    def get_all_tasks(self) -> List[Task]:
+        return self._call('get_all_tasks', self.backend.get_all_tasks)
+
+    def find_tasks(self,
+                   status: Optional[Status] = None,
+                   priority: Optional[Priority] = None,
+                   due_before: Optional[datetime] = None,
+                   sort_by: Optional[str] = None) -> List[Task]:
+        return self._call('find_tasks', self.backend.find_tasks,
+                          status, priority, due_before, sort_by)
+
+    def get_task(self, task_id: str) -> Task:
+        return self._call('get_task', self.backend.get_task, task_id)
+
+    def update_task(self, task_id: str, updates: Dict[str, Any]) -> bool:
+        return self._call('update_task', self.backend.update_task, task_id, updates)
+
+    def delete_task(self, task_id: str) -> bool:
+        attempts = []
+
+        def delete():
+            attempts.append(task_id)
+            deleted = self.backend.delete_task(task_id)
+            # Nothing to delete on a retry means an earlier attempt removed the
+            # task and only its reply was lost. This also reports True if the
+            # task never existed and the first attempt failed before reaching
+            # the server; callers check existence first, as TaskCLI does.
+            return deleted or len(attempts) > 1
+
+        return self._call('delete_task', delete)
@@ -0,0 +1,242 @@
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from db.database import (DatabaseInterface, PRIORITY_RANK, SQLITE_URI_PREFIX,
+                         is_sqlite_uri, validate_sort_key)
+from db.errors import DatabaseError, TransientDatabaseError
+from models.task import Task, Priority, Status
+
+COLUMNS = ('task_id', 'title', 'description', 'due_date',
+           'priority', 'status', 'creation_timestamp')
+
+UPDATABLE_COLUMNS = frozenset(COLUMNS) - {'task_id', 'creation_timestamp'}
+
+_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def path_from_uri(uri: str) -> str:
+    """
+    Extract the file path from a sqlite URI.
+
+    sqlite:///tasks.db is relative to the working directory,
+    sqlite:////var/lib/tasks.db is absolute and sqlite:///:memory: is in-memory.
+    """
+    if not is_sqlite_uri(uri):
+        raise ValueError(f"Not a sqlite URI: {uri}")
+    path = uri[len(SQLITE_URI_PREFIX):]
+    if not path:
+        raise ValueError("sqlite URI is missing a database path")
+    return path
+
+
+def _translate_error(action: str, error: sqlite3.Error) -> DatabaseError:
+    """Map a sqlite3 error onto the retryable / non-retryable error types"""
+    message = f"Error {action}: {error}"
+    # Lock contention from another writer clears up on its own
+    if isinstance(error, sqlite3.OperationalError) and (
+            "locked" in str(error) or "busy" in str(error)):
+        return TransientDatabaseError(message)
+    return DatabaseError(message)
+
+
+class SQLiteDatabaseManager(DatabaseInterface):
+    """Embedded SQLite implementation for storage"""
+
+    def __init__(self,
+                 uri: str,
+                 collection_name: Optional[str] = None,
+                 timeout_ms: int = 5000):
+        """
+        Args:
+            uri: sqlite:/// URI of the database file
+            collection_name: Table holding the tasks
+            timeout_ms: How long to wait on a locked database before failing
+        """
+        self.uri = uri
+        self.path = path_from_uri(uri)
+        self.table = collection_name or "tasks"
+        if not _TABLE_NAME.match(self.table):
+            raise ValueError(f"Invalid table name: {self.table}")
+        self.timeout_ms = timeout_ms
+        self._connection = None
+        self._busy_timeout_ms = timeout_ms
+        self._applied_busy_timeout_ms = timeout_ms
+
+        # Statements are built once; sqlite3 caches the prepared form per SQL text
+        columns = ", ".join(COLUMNS)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        self._sql_insert = (f"INSERT OR IGNORE INTO {self.table} ({columns}) "
+                            f"VALUES ({placeholders})")
+        self._sql_select = f"SELECT {columns} FROM {self.table}"
+        self._sql_get = f"{self._sql_select} WHERE task_id = ?"
+        self._sql_delete = f"DELETE FROM {self.table} WHERE task_id = ?"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection handle, opened on first database use"""
+        if self._connection is None:
+            self._open()
+        if self._busy_timeout_ms != self._applied_busy_timeout_ms:
+            self._connection.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+            self._applied_busy_timeout_ms = self._busy_timeout_ms
+        return self._connection
+
+    def connect(self):
+        # Opened lazily by the first operation, matching DatabaseManager
+        pass
+
+    def _open(self):
+        try:
+            connection = sqlite3.connect(self.path,
+                                         timeout=self.timeout_ms / 1000,
+                                         cached_statements=64)
+            # WAL lets readers proceed while a write is in progress;
+            # NORMAL sync is durable across application crashes in WAL mode
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(connection)
+            self._connection = connection
+
+            print(f"Connected to SQLite: {self.path}")
+        except sqlite3.Error as e:
+            raise _translate_error("connecting to SQLite", e) from e
+
+    def _create_schema(self, connection: sqlite3.Connection):
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "task_id TEXT PRIMARY KEY, "
+                "title TEXT NOT NULL, "
+                "description TEXT NOT NULL DEFAULT '', "
+                "due_date TEXT NOT NULL, "
+                "priority TEXT NOT NULL, "
+                "status TEXT NOT NULL, "
+                "creation_timestamp TEXT NOT NULL)"
+            )
+            # task_id is covered by the primary key
+            for column in ('status', 'priority', 'due_date'):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.table}_{column} "
+                    f"ON {self.table} ({column})"
+                )
+
+    def set_timeout(self, timeout):
+        # Applied as the busy timeout before the next statement runs
+        if timeout is None:
+            self._busy_timeout_ms = self.timeout_ms
+        else:
+            self._busy_timeout_ms = max(1, min(self.timeout_ms, int(timeout * 1000)))
+
+    def disconnect(self):
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+            self._applied_busy_timeout_ms = self.timeout_ms
+            print("Disconnected from SQLite")
+
+    @staticmethod
+    def _row(task: Task) -> tuple:
+        task_dict = task.to_dict()
+        return tuple(task_dict[column] for column in COLUMNS)
+
+    @staticmethod
+    def _task(row: tuple) -> Task:
+        return Task.from_dict(dict(zip(COLUMNS, row)))
+
+    def add_task(self, task: Task) -> bool:
+        try:
+            with self.connection as connection:
+                # Ignoring an existing task_id keeps retried inserts idempotent
+                connection.execute(self._sql_insert, self._row(task))
+            return True
+        except sqlite3.Error as e:
+            raise _translate_error("adding task", e) from e
+
+    def add_tasks(self, tasks: List[Task]) -> int:
+        if not tasks:
+            return 0
+        try:
+            # One transaction for the whole batch
+            with self.connection as connection:
+                before = connection.total_changes
+                connection.executemany(self._sql_insert,
+                                       (self._row(task) for task in tasks))
+                return connection.total_changes - before
+        except sqlite3.Error as e:
+            raise _translate_error("adding tasks", e) from e
+
+    def get_task(self, task_id):
+        try:
+            row = self.connection.execute(self._sql_get, (task_id,)).fetchone()
+            return self._task(row) if row else None
+        except sqlite3.Error as e:
+            raise _translate_error("retrieving task", e) from e
+
+    def get_all_tasks(self) -> List[Task]:
+        return self.find_tasks()
+
+    def find_tasks(self,
+                   status: Optional[Status] = None,
+                   priority: Optional[Priority] = None,
+                   due_before: Optional[datetime] = None,
+                   sort_by: Optional[str] = None) -> List[Task]:
+        validate_sort_key(sort_by)
+
+        clauses = []
+        params = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if priority:
+            clauses.append("priority = ?")
+            params.append(priority.value)
+        if due_before:
+            # ISO-8601 strings compare in chronological order
+            clauses.append("due_date <= ?")
+            params.append(due_before.isoformat())
+
+        sql = self._sql_select
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if sort_by == 'priority':
+            ranks = " ".join(f"WHEN '{p.value}' THEN {rank}"
+                             for p, rank in PRIORITY_RANK.items())
+            sql += f" ORDER BY CASE priority {ranks} END"
+        elif sort_by:
+            sql += f" ORDER BY {sort_by}"
+
+        try:
+            cursor = self.connection.execute(sql, params)
+            return [self._task(row) for row in cursor]
+        except sqlite3.Error as e:
+            raise _translate_error("retrieving tasks", e) from e
+
+    def update_task(self, task_id: str, updates: Dict[str, Any]) -> bool:
+        unknown = set(updates) - UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
+        if not updates:
+            return self.get_task(task_id) is not None
+
+        # Column order is fixed so each field combination maps to one cached statement
+        columns = [column for column in COLUMNS if column in updates]
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        params = [updates[column] for column in columns] + [task_id]
+        try:
+            with self.connection as connection:
+                cursor = connection.execute(
+                    f"UPDATE {self.table} SET {assignments} WHERE task_id = ?", params)
+            # Counts matched rows, so re-applying the same update still succeeds
+            return cursor.rowcount >= 1
+        except sqlite3.Error as e:
+            raise _translate_error("updating task", e) from e
+
+    def delete_task(self, task_id: str) -> bool:
+        try:
+            with self.connection as connection:
+                cursor = connection.execute(self._sql_delete, (task_id,))
+            return cursor.rowcount >= 1
+        except sqlite3.Error as e:
+            raise _translate_error("deleting task", e) from e
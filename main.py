@@ -1,37 +1,115 @@
+import os
 import sys
-from config.config import Config
-from db.database_manager import DatabaseManager
+import time
+from importlib import import_module
+from typing import Optional
 
-from manager.task_manager import TaskManager
-from manager.task_cli import TaskCLI
+_MAIN_IMPORT_START = time.perf_counter()
+
+STARTUP_TIME_FLAG = "--startup-time"
+
+
+def _timed_import(module_name: str, timings: list):
+    """Import a module and record how long it took"""
+    start = time.perf_counter()
+    module = import_module(module_name)
+    timings.append((f"import {module_name}", time.perf_counter() - start))
+    return module
+
+
+def _timed(label: str, timings: list, func, *args, **kwargs):
+    """Call func and record how long it took"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    timings.append((label, time.perf_counter() - start))
+    return result
+
+
+def _process_age() -> Optional[float]:
+    """
+    Seconds since the OS created this process, covering interpreter and
+    site startup. Read from /proc (10 ms resolution); None where unavailable.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        # starttime is field 22; fields are counted after the "(comm)" name
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _print_startup_report(timings: list,
+                          since_import: float,
+                          since_process_start: Optional[float]):
+    """Print the startup-time breakdown"""
+    print("\n" + "="*50)
+    print("STARTUP TIME")
+    print("="*50)
+    for label, elapsed in timings:
+        print(f"{label:<36} {elapsed * 1000:9.2f} ms")
+    print("-"*50)
+    print(f"{'first prompt, since main.py import':<36} {since_import * 1000:9.2f} ms")
+    if since_process_start is not None:
+        print(f"{'first prompt, since process start':<36} {since_process_start * 1000:9.2f} ms")
+    else:
+        print(f"{'first prompt, since process start':<36} {'n/a':>9}")
+    print("="*50)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    measure_startup = STARTUP_TIME_FLAG in argv
+    timings = []
 
-def main():
     try:
-        
-        db_config = Config.get_database_config()
-        
-        database = DatabaseManager(**db_config)
-        
-        # Connect to database
-        database.connect()
-        
+        # Imported here so the breakdown can attribute time per module
+        config = _timed_import("config.config", timings)
+        factory = _timed_import("db.factory", timings)
+        resilience = _timed_import("db.resilience", timings)
+        task_manager_module = _timed_import("manager.task_manager", timings)
+        task_cli = _timed_import("manager.task_cli", timings)
+
+        db_config = _timed("load config", timings,
+                           config.Config.get_database_config)
+        resilience_config = config.Config.get_resilience_config()
+
+        # Backend chosen by URI scheme; its connection opens on first use
+        backend = _timed("create database manager", timings,
+                         factory.create_database, **db_config)
+
+        # Deadlines, retries and circuit breaker around every operation
+        database = resilience.ResilientDatabase.from_config(backend, **resilience_config)
+
         # Initialize task manager
-        task_manager = TaskManager(database)
-        
+        task_manager = _timed("create task manager", timings,
+                              task_manager_module.TaskManager, database)
+
         # Initialize CLI
-        cli = TaskCLI(task_manager)
-        
+        cli = task_cli.TaskCLI(task_manager)
+
+        if measure_startup:
+            # Render everything up to the first prompt, then report and exit
+            cli.entry()
+            cli.display_menu()
+            since_import = time.perf_counter() - _MAIN_IMPORT_START
+            _print_startup_report(timings, since_import, _process_age())
+            return 0
+
         # Run application
         cli.run()
-        
+
         # Cleanup
         database.disconnect()
-        
+
         return 0
-    
+
     except Exception as e:
         print(f"\nUnexpected Error: {e}")
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
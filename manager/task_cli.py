@@ -1,6 +1,7 @@
 import sys
 from datetime import datetime, timedelta
 
+from db.errors import CircuitOpenError, DatabaseError
 from manager.task_manager import TaskManager
 from models.task import Task, Priority, Status
 
@@ -29,6 +30,10 @@ class TaskCLI:
             except KeyboardInterrupt:
                 print("\n\nExiting application...")
                 self.running = False
+            except CircuitOpenError:
+                print("\nDatabase is unavailable. Please try again shortly.")
+            except DatabaseError as e:
+                print(f"\nDatabase error: {e}")
             except Exception as e:
                 print(f"\nError: {e}")
 
@@ -102,6 +107,8 @@ class TaskCLI:
             else:
                 print("\nFailed to create task")
                 
+        except DatabaseError:
+            raise
         except ValueError as e:
             print(f"\nInvalid input: {e}")
         except Exception as e:
@@ -126,10 +133,16 @@ class TaskCLI:
         if priority_input:
             filter_priority = self._parse_priority(priority_input)
         
+        sort_by = None
+        sort_input = input("Sort by (1=Due Date, 2=Priority, 3=Created): ").strip()
+        if sort_input:
+            sort_by = self._parse_sort(sort_input)
+        
         # Get tasks
         tasks = self.task_manager.list_tasks(
             filter_status=filter_status,
-            filter_priority=filter_priority
+            filter_priority=filter_priority,
+            sort_by=sort_by
         )
         
         if not tasks:
@@ -256,6 +269,14 @@ class TaskCLI:
             raise ValueError("Invalid status. Use 1, 2, or 3")
         return status
 
+    def _parse_sort(self, sort_str: str) -> str:
+        """Parse sort order string."""
+        sort_map = {'1': 'due_date', '2': 'priority', '3': 'creation_timestamp'}
+        sort_by = sort_map.get(sort_str)
+        if not sort_by:
+            raise ValueError("Invalid sort order. Use 1, 2, or 3")
+        return sort_by
+
     def _print_task_summary(self, index: int, task: Task):
         """Print task summary."""
         status_icon = "Complete" if task.status == Status.COMPLETED else "Incomplete"
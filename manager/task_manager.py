@@ -3,6 +3,7 @@ from datetime import datetime
 
 from models.task import Task, Priority, Status
 from db.database import DatabaseInterface
+from db.errors import DatabaseError
 
 class TaskManager:
     """
@@ -20,11 +21,7 @@ class TaskManager:
         return self.db_interface.get_all_tasks()
     
     def get_task(self, task_id: str) -> Optional[Task]:
-        for task in self.get_all_tasks():
-            if task.task_id == task_id:
-                return task
-            
-        return None
+        return self.db_interface.get_task(task_id)
 
     def add_task(self, 
                 title: str, 
@@ -39,6 +36,8 @@ class TaskManager:
                 priority=priority)
             if self.db_interface.add_task(task):
                 return task
+        except DatabaseError:
+            raise
         except Exception as e:
             print(f"Error adding task: {e}")
             return None
@@ -46,37 +45,16 @@ class TaskManager:
     def list_tasks(self, 
                    filter_status: Optional[Status] = None,
                    filter_priority: Optional[Priority] = None,
-                   filter_due_before: Optional[datetime] = None) -> List[Task]:
+                   filter_due_before: Optional[datetime] = None,
+                   sort_by: Optional[str] = None) -> List[Task]:
         
-        tasks = self.db_interface.get_all_tasks()
-        filtered_tasks = self._apply_filters(
-            tasks, 
-            filter_status, 
-            filter_priority, 
-            filter_due_before
+        # Filtering and sorting are done by the database backend
+        return self.db_interface.find_tasks(
+            status=filter_status,
+            priority=filter_priority,
+            due_before=filter_due_before,
+            sort_by=sort_by
         )
-        
-        return filtered_tasks
-    
-    def _apply_filters(self, tasks: List[Task],
-                      status: Optional[Status],
-                      priority: Optional[Priority],
-                      due_before: Optional[datetime]) -> List[Task]:
-        """
-        Apply filters to task list.
-        """
-        filtered = tasks
-        
-        if status:
-            filtered = [t for t in filtered if t.status == status]
-        
-        if priority:
-            filtered = [t for t in filtered if t.priority == priority]
-        
-        if due_before:
-            filtered = [t for t in filtered if t.due_date <= due_before]
-        
-        return filtered
     
     def update_task(self, task_id: str, **updates) -> bool:
         try:
@@ -107,6 +85,8 @@ class TaskManager:
             
             return self.db_interface.update_task(task_id, db_updates)
         
+        except DatabaseError:
+            raise
         except Exception as e:
             print(f"Error updating task: {e}")
             return False
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from itertools import product
+
+import pytest
+
+from db.database import DatabaseInterface, SORT_KEYS
+from db.database_manager import DatabaseManager
+from models.task import Task, Priority, Status
+
+NOW = datetime(2026, 1, 1, 9, 0, 0)
+
+
+class StubWriteConcern:
+    def __init__(self, document):
+        self.document = document
+
+
+class StubCursor:
+    def __init__(self, documents):
+        self.documents = documents
+        self.sorts = []
+
+    def sort(self, key, direction):
+        self.sorts.append((key, direction))
+        self.documents = sorted(self.documents, key=lambda d: d[key],
+                                reverse=direction < 0)
+        return self
+
+    def __iter__(self):
+        return iter(self.documents)
+
+
+class StubCollection:
+    """
+    Records calls made by DatabaseManager instead of talking to MongoDB.
+
+    find understands the subset of the query language the manager uses:
+    equality, $lte and an exclusion projection.
+    """
+
+    def __init__(self, write_concern=None, documents=()):
+        self.write_concern = StubWriteConcern(write_concern or {})
+        self.options = []
+        self.documents = [dict(document, _id=index)
+                          for index, document in enumerate(documents)]
+        self.finds = []
+        self.cursors = []
+
+    def with_options(self, **options):
+        self.options.append(options)
+        return self
+
+    @staticmethod
+    def _matches(document, query):
+        for field, condition in query.items():
+            if isinstance(condition, dict):
+                if not document[field] <= condition['$lte']:
+                    return False
+            elif document[field] != condition:
+                return False
+        return True
+
+    def find(self, query, projection=None, **kwargs):
+        self.finds.append((query, projection, kwargs))
+        documents = [dict(d) for d in self.documents if self._matches(d, query)]
+        for field, include in (projection or {}).items():
+            if not include:
+                for document in documents:
+                    document.pop(field, None)
+        cursor = StubCursor(documents)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def make_manager(collection, timeout_ms=5000):
+    manager = DatabaseManager("mongodb://localhost", "taskmanagement", "tasks",
+                              timeout_ms=timeout_ms)
+    manager._collection = collection
+    return manager
+
+
+@pytest.mark.parametrize("document", [{}, {'w': 1}, {'w': 0}, {'w': 1, 'j': True}])
+def test_writer_keeps_concern_without_replication_wait(document):
+    collection = StubCollection(document)
+
+    assert make_manager(collection)._writer() is collection
+    assert collection.options == []
+
+
+def test_writer_merges_wtimeout_into_configured_concern():
+    pytest.importorskip("pymongo")
+    collection = StubCollection({'w': 'majority', 'j': True})
+    manager = make_manager(collection, timeout_ms=5000)
+    manager.set_timeout(1.5)
+
+    manager._writer()
+
+    concern = collection.options[0]['write_concern'].document
+    assert concern == {'w': 'majority', 'j': True, 'wtimeout': 1500}
+
+
+def make_task(index: int) -> Task:
+    return Task(title=f"Task {index}",
+                description="",
+                due_date=NOW + timedelta(days=index % 7, minutes=index),
+                priority=list(Priority)[index % 3],
+                status=list(Status)[index // 3 % 3],
+                task_id=f"task-{index:04d}",
+                creation_timestamp=NOW - timedelta(minutes=index * 7 % 50))
+
+
+@pytest.fixture
+def seeded_manager():
+    documents = [make_task(i).to_dict() for i in range(40)]
+    return make_manager(StubCollection(documents=documents))
+
+
+def test_find_tasks_builds_server_side_query(seeded_manager):
+    due_before = NOW + timedelta(days=2)
+    seeded_manager.set_timeout(1.5)
+
+    seeded_manager.find_tasks(Status.PENDING, Priority.HIGH, due_before, 'due_date')
+
+    query, projection, kwargs = seeded_manager.collection.finds[-1]
+    assert query == {'status': 'Pending',
+                     'priority': 'High',
+                     'due_date': {'$lte': due_before.isoformat()}}
+    assert projection == {'_id': 0}
+    assert kwargs == {'max_time_ms': 1500}
+    assert seeded_manager.collection.cursors[-1].sorts == [('due_date', 1)]
+
+
+def test_find_tasks_ranks_priority_client_side(seeded_manager):
+    tasks = seeded_manager.find_tasks(sort_by='priority')
+
+    assert seeded_manager.collection.cursors[-1].sorts == []
+    assert [t.priority for t in tasks[:2]] == [Priority.HIGH, Priority.HIGH]
+    assert tasks[-1].priority == Priority.LOW
+
+
+def test_find_tasks_matches_reference_implementation(seeded_manager):
+    statuses = [None] + list(Status)
+    priorities = [None] + list(Priority)
+    due_dates = [None, NOW + timedelta(days=3)]
+    for status, priority, due_before in product(statuses, priorities, due_dates):
+        expected = DatabaseInterface.find_tasks(seeded_manager, status, priority, due_before)
+        actual = seeded_manager.find_tasks(status, priority, due_before)
+        assert {t.task_id for t in actual} == {t.task_id for t in expected}
+
+
+@pytest.mark.parametrize("sort_by", SORT_KEYS)
+def test_sorting_matches_reference_implementation(seeded_manager, sort_by):
+    expected = DatabaseInterface.find_tasks(seeded_manager, sort_by=sort_by)
+    actual = seeded_manager.find_tasks(sort_by=sort_by)
+
+    key = (lambda t: t.priority) if sort_by == 'priority' else (lambda t: getattr(t, sort_by))
+    assert [key(t) for t in actual] == [key(t) for t in expected]
+
+
+def test_find_tasks_rejects_invalid_sort_key(seeded_manager):
+    with pytest.raises(ValueError):
+        seeded_manager.find_tasks(sort_by="title")
+    assert seeded_manager.collection.finds == []
@@ -0,0 +1,249 @@
+from datetime import datetime
+
+import pytest
+
+from db.database import DatabaseInterface
+from db.errors import (CircuitOpenError, DatabaseError, DatabaseTimeoutError,
+                       TransientDatabaseError)
+from db.resilience import CircuitBreaker, ResilientDatabase, RetryPolicy
+from models.task import Task, Priority
+
+
+class FakeClock:
+    """Manually advanced time source shared by the breaker and the wrapper"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FaultyDatabase(DatabaseInterface):
+    """
+    Stand-in backend that raises queued faults.
+
+    Each call applies its effect, advances the clock by `latency` to
+    simulate a slow server, then raises the next queued fault if any,
+    like a server whose reply was lost. `tasks` holds the stored task IDs.
+    """
+
+    def __init__(self, clock: FakeClock, faults=(), latency: float = 0.0, tasks=()):
+        self.clock = clock
+        self.faults = list(faults)
+        self.latency = latency
+        self.tasks = set(tasks)
+        self.calls = 0
+        self.timeouts = []
+
+    def _answer(self, result):
+        self.calls += 1
+        self.clock.now += self.latency
+        if self.faults:
+            raise self.faults.pop(0)
+        return result
+
+    def set_timeout(self, timeout):
+        self.timeouts.append(timeout)
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def add_task(self, task):
+        self.tasks.add(task.task_id)
+        return self._answer(True)
+
+    def get_task(self, task_id):
+        return self._answer(None)
+
+    def update_task(self, task_id, updates):
+        return self._answer(task_id in self.tasks)
+
+    def delete_task(self, task_id):
+        deleted = task_id in self.tasks
+        self.tasks.discard(task_id)
+        return self._answer(deleted)
+
+    def get_all_tasks(self):
+        return self._answer([])
+
+
+def make_database(backend, clock, timeout=10.0, max_attempts=3,
+                  failure_threshold=5, reset_timeout=30.0):
+    return ResilientDatabase(
+        backend,
+        timeout=timeout,
+        retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0.1, max_delay=2.0),
+        circuit_breaker=CircuitBreaker(failure_threshold=failure_threshold,
+                                       reset_timeout=reset_timeout,
+                                       clock=clock),
+        clock=clock,
+        sleep=clock.sleep)
+
+
+def test_transient_errors_are_retried():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("failover")] * 2)
+    database = make_database(backend, clock)
+
+    assert database.get_all_tasks() == []
+    assert backend.calls == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_transient_error_raised_after_max_attempts():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("down")] * 5)
+    database = make_database(backend, clock, max_attempts=3)
+
+    with pytest.raises(TransientDatabaseError):
+        database.get_all_tasks()
+    assert backend.calls == 3
+
+
+def test_non_transient_errors_are_not_retried():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[DatabaseError("bad query")])
+    database = make_database(backend, clock)
+
+    with pytest.raises(DatabaseError) as excinfo:
+        database.get_all_tasks()
+    assert not isinstance(excinfo.value, TransientDatabaseError)
+    assert backend.calls == 1
+    assert clock.sleeps == []
+
+
+def test_delete_retried_after_lost_reply_reports_success():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("reply lost")],
+                             tasks={"task-1"})
+    database = make_database(backend, clock)
+
+    assert database.delete_task("task-1")
+    assert backend.tasks == set()
+    assert backend.calls == 2
+
+
+def test_delete_of_missing_task_without_retry_reports_failure():
+    clock = FakeClock()
+    database = make_database(FaultyDatabase(clock), clock)
+
+    assert not database.delete_task("missing")
+
+
+def test_backoff_stays_within_deadline():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("down")] * 50,
+                             latency=0.5)
+    database = make_database(backend, clock, timeout=3.0, max_attempts=50)
+
+    with pytest.raises(DatabaseTimeoutError):
+        database.get_all_tasks()
+    assert clock.now <= 3.0 + backend.latency
+    # Each attempt is told how much of the budget is left
+    attempt_timeouts = [t for t in backend.timeouts if t is not None]
+    assert all(0 < t <= 3.0 for t in attempt_timeouts)
+    assert attempt_timeouts == sorted(attempt_timeouts, reverse=True)
+
+
+def test_backoff_delays_are_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+    for attempt in range(1, 10):
+        ceiling = min(1.0, 0.1 * 2 ** (attempt - 1))
+        assert 0 <= policy.delay(attempt) <= ceiling
+
+
+def test_slow_read_past_deadline_times_out():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, latency=30.0)
+    database = make_database(backend, clock, timeout=10.0)
+
+    with pytest.raises(DatabaseTimeoutError):
+        database.get_all_tasks()
+    assert backend.timeouts[-1] is None
+
+
+def test_slow_write_past_deadline_reports_success():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, latency=30.0)
+    database = make_database(backend, clock, timeout=10.0)
+    task = Task("Title", "", datetime(2026, 1, 1), Priority.LOW)
+
+    # The write was applied, so the caller must not be told to try again
+    assert database.add_task(task)
+    assert database.update_task(task.task_id, {'title': 'New'})
+    assert task.task_id in backend.tasks
+    assert backend.calls == 2
+
+
+def test_breaker_opens_then_recovers():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("down")] * 2)
+    database = make_database(backend, clock, max_attempts=1,
+                             failure_threshold=2, reset_timeout=30.0)
+    breaker = database.circuit_breaker
+
+    for _ in range(2):
+        with pytest.raises(TransientDatabaseError):
+            database.get_all_tasks()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Fails fast without touching the backend while open
+    with pytest.raises(CircuitOpenError):
+        database.get_all_tasks()
+    assert backend.calls == 2
+
+    clock.now += 30.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one trial call at a time
+    assert not breaker.allow_request()
+    breaker.release()
+
+    assert database.get_all_tasks() == []
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_reopens_when_trial_fails():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("down")] * 2)
+    database = make_database(backend, clock, max_attempts=1,
+                             failure_threshold=1, reset_timeout=30.0)
+
+    with pytest.raises(TransientDatabaseError):
+        database.get_all_tasks()
+    clock.now += 30.0
+
+    with pytest.raises(TransientDatabaseError):
+        database.get_all_tasks()
+    assert database.circuit_breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        database.get_all_tasks()
+
+
+def test_unrelated_error_in_half_open_trial_releases_slot():
+    clock = FakeClock()
+    backend = FaultyDatabase(clock, faults=[TransientDatabaseError("down"),
+                                            ValueError("bad argument")])
+    database = make_database(backend, clock, max_attempts=1,
+                             failure_threshold=1, reset_timeout=30.0)
+
+    with pytest.raises(TransientDatabaseError):
+        database.get_all_tasks()
+    clock.now += 30.0
+
+    with pytest.raises(ValueError):
+        database.get_all_tasks()
+    assert database.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+    # The next call gets the trial slot and closes the breaker
+    assert database.get_all_tasks() == []
+    assert database.circuit_breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,168 @@
+import sqlite3
+from datetime import datetime, timedelta
+from itertools import product
+
+import pytest
+
+from db.database import DatabaseInterface, SORT_KEYS
+from db.errors import DatabaseError, TransientDatabaseError
+from db.sqlite_manager import SQLiteDatabaseManager
+from models.task import Task, Priority, Status
+
+NOW = datetime(2026, 1, 1, 9, 0, 0)
+
+
+def make_task(index: int) -> Task:
+    return Task(title=f"Task {index}",
+                description=f"Description {index}",
+                due_date=NOW + timedelta(days=index % 7, minutes=index),
+                priority=list(Priority)[index % 3],
+                status=list(Status)[index // 3 % 3],
+                task_id=f"task-{index:04d}",
+                creation_timestamp=NOW - timedelta(minutes=index * 7 % 50))
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = SQLiteDatabaseManager(f"sqlite:///{tmp_path / 'tasks.db'}")
+    yield db
+    db.disconnect()
+
+
+def test_uses_wal_and_indexes(database):
+    connection = database.connection
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE status = ?", ("Pending",)).fetchall()
+    assert "idx_tasks_status" in plan[0][-1]
+
+
+def test_find_tasks_matches_reference_implementation(database):
+    database.add_tasks([make_task(i) for i in range(60)])
+
+    statuses = [None] + list(Status)
+    priorities = [None] + list(Priority)
+    due_dates = [None, NOW + timedelta(days=3)]
+    for status, priority, due_before in product(statuses, priorities, due_dates):
+        # Sorting is checked separately, where ties do not matter
+        expected = DatabaseInterface.find_tasks(database, status, priority, due_before)
+        actual = database.find_tasks(status, priority, due_before)
+        assert {t.task_id for t in actual} == {t.task_id for t in expected}
+
+
+@pytest.mark.parametrize("sort_by", SORT_KEYS)
+def test_sorting_matches_reference_implementation(database, sort_by):
+    database.add_tasks([make_task(i) for i in range(60)])
+
+    expected = DatabaseInterface.find_tasks(database, sort_by=sort_by)
+    actual = database.find_tasks(sort_by=sort_by)
+
+    if sort_by == 'priority':
+        key = lambda t: t.priority
+    else:
+        key = lambda t: getattr(t, sort_by)
+    assert [key(t) for t in actual] == [key(t) for t in expected]
+
+
+def test_invalid_sort_key_is_rejected(database):
+    with pytest.raises(ValueError):
+        database.find_tasks(sort_by="title; DROP TABLE tasks")
+
+
+def test_insert_is_idempotent(database):
+    task = make_task(1)
+
+    assert database.add_task(task)
+    assert database.add_task(task)
+    assert len(database.get_all_tasks()) == 1
+
+
+def test_add_tasks_counts_only_new_rows(database):
+    tasks = [make_task(i) for i in range(20)]
+
+    assert database.add_tasks(tasks) == 20
+    assert database.add_tasks(tasks[:5] + [make_task(20)]) == 1
+    assert database.add_tasks([]) == 0
+    assert len(database.get_all_tasks()) == 21
+
+
+def test_round_trip_preserves_fields(database):
+    task = make_task(3)
+    database.add_task(task)
+
+    assert database.get_task(task.task_id).to_dict() == task.to_dict()
+    assert database.get_task("missing") is None
+
+
+def test_repeated_update_reports_matched_rows(database):
+    task = make_task(1)
+    database.add_task(task)
+    updates = {'status': Status.COMPLETED.value}
+
+    assert database.update_task(task.task_id, updates)
+    assert database.update_task(task.task_id, updates)
+    assert not database.update_task("missing", updates)
+    assert database.get_task(task.task_id).status == Status.COMPLETED
+
+
+def test_update_rejects_unknown_columns(database):
+    database.add_task(make_task(1))
+
+    with pytest.raises(ValueError):
+        database.update_task("task-0001", {'task_id': 'other'})
+
+
+def test_delete_task(database):
+    database.add_task(make_task(1))
+
+    assert database.delete_task("task-0001")
+    assert not database.delete_task("task-0001")
+
+
+def busy_timeout(database) -> int:
+    return database.connection.execute("PRAGMA busy_timeout").fetchone()[0]
+
+
+def test_set_timeout_caps_busy_timeout(tmp_path):
+    database = SQLiteDatabaseManager(f"sqlite:///{tmp_path / 'tasks.db'}", timeout_ms=2000)
+    assert busy_timeout(database) == 2000
+
+    database.set_timeout(0.25)
+    assert busy_timeout(database) == 250
+
+    # Never waits longer than configured, and None restores the default
+    database.set_timeout(60)
+    assert busy_timeout(database) == 2000
+    database.set_timeout(0.25)
+    database.set_timeout(None)
+    assert busy_timeout(database) == 2000
+    database.disconnect()
+
+
+def test_lock_error_is_transient(tmp_path):
+    uri = f"sqlite:///{tmp_path / 'tasks.db'}"
+    database = SQLiteDatabaseManager(uri, timeout_ms=10)
+    database.get_all_tasks()
+
+    # Another writer holds the write lock
+    other = sqlite3.connect(str(tmp_path / 'tasks.db'), isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(TransientDatabaseError):
+            database.add_task(make_task(1))
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+        database.disconnect()
+
+
+def test_other_errors_are_not_transient(tmp_path):
+    database = SQLiteDatabaseManager(f"sqlite:///{tmp_path / 'tasks.db'}")
+    database.get_all_tasks()
+    database.connection.execute("DROP TABLE tasks")
+
+    with pytest.raises(DatabaseError) as excinfo:
+        database.get_all_tasks()
+    assert not isinstance(excinfo.value, TransientDatabaseError)
+    database.disconnect()
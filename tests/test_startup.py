@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config.config import Config
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CONFIG_ATTRIBUTES = ('env_path', 'DATABASE_URI', 'MONGO_URI', 'MONGO_DATABASE',
+                     'MONGO_COLLECTION', 'MONGO_TIMEOUT_MS', 'DB_OPERATION_TIMEOUT',
+                     'DB_MAX_ATTEMPTS', 'DB_CIRCUIT_FAILURES', 'DB_CIRCUIT_RESET',
+                     '_database_config', '_resilience_config')
+
+
+@pytest.fixture
+def fresh_config(monkeypatch, tmp_path):
+    """Unloaded Config whose class attributes are restored after the test"""
+    for name in CONFIG_ATTRIBUTES:
+        monkeypatch.setattr(Config, name, getattr(Config, name))
+    monkeypatch.setattr(Config, '_database_config', None)
+    monkeypatch.setattr(Config, '_resilience_config', None)
+    monkeypatch.setattr(Config, 'env_path', tmp_path / ".env")
+    for name in ('DATABASE_URI', 'MONGO_URI', 'MONGO_DB', 'MONGO_COLLECTION'):
+        monkeypatch.delenv(name, raising=False)
+    return Config
+
+
+def test_config_reads_environment_once(fresh_config, monkeypatch):
+    monkeypatch.setenv('MONGO_URI', 'mongodb://first')
+    monkeypatch.setenv('MONGO_DB', 'taskmanagement')
+
+    first = fresh_config.get_database_config()
+    monkeypatch.setenv('MONGO_URI', 'mongodb://second')
+
+    assert fresh_config.get_database_config() == first
+    assert first['uri'] == 'mongodb://first'
+    assert first['db_name'] == 'taskmanagement'
+
+
+def test_config_returns_copies_of_cache(fresh_config):
+    fresh_config.get_database_config()['uri'] = 'changed'
+    fresh_config.get_resilience_config()['timeout'] = -1
+
+    assert fresh_config.get_database_config()['uri'] != 'changed'
+    assert fresh_config.get_resilience_config()['timeout'] != -1
+
+
+def test_config_reads_env_file_once(fresh_config, monkeypatch):
+    dotenv = pytest.importorskip("dotenv")
+    fresh_config.env_path.write_text('MONGO_URI="mongodb://from-file"\n')
+    calls = []
+    original = dotenv.load_dotenv
+    monkeypatch.setattr(dotenv, 'load_dotenv',
+                        lambda **kwargs: calls.append(kwargs) or original(**kwargs))
+
+    assert fresh_config.get_database_config()['uri'] == 'mongodb://from-file'
+    fresh_config.get_resilience_config()
+    fresh_config.get_database_config()
+    assert len(calls) == 1
+
+
+def test_startup_time_mode_skips_heavy_imports():
+    # A fresh interpreter, so modules loaded by other tests do not count
+    script = (
+        "import sys\n"
+        "import main\n"
+        "code = main.main(['--startup-time'])\n"
+        "heavy = [m for m in sys.modules if m.split('.')[0] in ('pymongo', 'dotenv')]\n"
+        "print('HEAVY', heavy)\n"
+        "sys.exit(code)\n"
+    )
+    env = {k: v for k, v in os.environ.items()
+           if k not in ('DATABASE_URI', 'MONGO_URI', 'MONGO_DB', 'MONGO_COLLECTION')}
+    env['MONGO_URI'] = 'mongodb://localhost:27017/'
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "STARTUP TIME" in result.stdout
+    if (ROOT / ".env").exists():
+        # A local .env legitimately pulls in dotenv; pymongo must still stay out
+        assert "pymongo" not in result.stdout.split("HEAVY", 1)[1]
+    else:
+        assert "HEAVY []" in result.stdout